@@ -7,23 +7,77 @@ Optimized for low-latency single-user voice chat application.
 import os
 import re
 import json
+import time
 import logging
 import asyncio
 import uuid
 import aiosqlite
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
+from collections import defaultdict, deque
 from datetime import datetime
 from pydantic import BaseModel
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj).decode()  # SQLite TEXT columns need str
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+    _JSONDecodeError = json.JSONDecodeError
+
+try:
+    import msgpack
+
+    def _pack_chars(active_characters) -> bytes:
+        return msgpack.packb(active_characters)
+
+    def _unpack_chars(value):
+        # Pre-msgpack rows (and the column default) are JSON text.
+        if isinstance(value, bytes):
+            return msgpack.unpackb(value, raw=False)
+        return _loads(value)
+
+    # audio_tokens are large numeric arrays — msgpack BLOBs are smaller and
+    # far cheaper to decode than JSON text. Old JSON rows still read fine.
+    _pack_tokens = _pack_chars
+    _unpack_tokens = _unpack_chars
+except ImportError:
+    _pack_chars = _dumps
+
+    def _unpack_chars(value):
+        return _loads(value)
+
+    _pack_tokens = _pack_chars
+    _unpack_tokens = _unpack_chars
+
+_now_cached = ""
+_now_tick = 0.0
+
+def _now() -> str:
+    """ISO timestamp for row binds, reused for up to 1ms between calls."""
+    global _now_cached, _now_tick
+    tick = time.monotonic()
+    if tick - _now_tick >= 0.001 or not _now_cached:
+        _now_cached = datetime.now().isoformat()
+        _now_tick = tick
+    return _now_cached
+
 ########################################
 ##--         Configuration          --##
 ########################################
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "database.db")
 
+# Slug patterns for character id generation, compiled once.
+_RE_NONALNUM = re.compile(r'[^a-z0-9\s-]')
+_RE_WS = re.compile(r'\s+')
+_RE_DASHES = re.compile(r'-+')
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS characters (
     id TEXT PRIMARY KEY,
@@ -55,6 +109,7 @@ CREATE TABLE IF NOT EXISTS conversations (
     conversation_id TEXT PRIMARY KEY,
     title TEXT,
     active_characters TEXT DEFAULT '[]',
+    message_count INTEGER NOT NULL DEFAULT 0,
     created_at TEXT DEFAULT (datetime('now')),
     updated_at TEXT DEFAULT (datetime('now'))
 );
@@ -71,11 +126,80 @@ CREATE TABLE IF NOT EXISTS messages (
     FOREIGN KEY (conversation_id) REFERENCES conversations(conversation_id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_messages_conversation_id ON messages(conversation_id);
+DROP INDEX IF EXISTS idx_messages_conversation_id;
+CREATE INDEX IF NOT EXISTS idx_messages_conv_created ON messages(conversation_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_messages_created_at ON messages(created_at);
+DROP INDEX IF EXISTS idx_conversations_updated_at;
+CREATE INDEX IF NOT EXISTS idx_conversations_updated ON conversations(updated_at DESC, conversation_id DESC);
 CREATE INDEX IF NOT EXISTS idx_characters_is_active ON characters(is_active);
+CREATE INDEX IF NOT EXISTS idx_characters_active_cover ON characters(is_active) WHERE is_active = 1;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS characters_fts USING fts5(
+    id UNINDEXED,
+    name,
+    content='characters',
+    content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS characters_fts_insert AFTER INSERT ON characters BEGIN
+    INSERT INTO characters_fts(rowid, id, name) VALUES (new.rowid, new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS characters_fts_delete AFTER DELETE ON characters BEGIN
+    INSERT INTO characters_fts(characters_fts, rowid, id, name) VALUES ('delete', old.rowid, old.id, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS characters_fts_update AFTER UPDATE OF name ON characters BEGIN
+    INSERT INTO characters_fts(characters_fts, rowid, id, name) VALUES ('delete', old.rowid, old.id, old.name);
+    INSERT INTO characters_fts(rowid, id, name) VALUES (new.rowid, new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_count_insert AFTER INSERT ON messages BEGIN
+    UPDATE conversations SET message_count = message_count + 1 WHERE conversation_id = new.conversation_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_count_delete AFTER DELETE ON messages BEGIN
+    UPDATE conversations SET message_count = message_count - 1 WHERE conversation_id = old.conversation_id;
+END;
 """
 
+PRAGMA_SQL = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=30000;
+PRAGMA wal_autocheckpoint=1000;
+PRAGMA foreign_keys=ON;
+"""
+
+# Fixed column orders so rows come back as plain tuples that the
+# _row_to_* helpers can unpack positionally (no per-field name lookups).
+CHAR_COLS = "id, name, voice, system_prompt, image_url, images, is_active, last_message, created_at, updated_at"
+VOICE_COLS = "voice, method, audio_path, text_path, speaker_desc, scene_prompt, audio_tokens, id, created_at, updated_at"
+CONV_COLS = "conversation_id, title, active_characters, created_at, updated_at"
+MSG_COLS = "message_id, conversation_id, role, name, content, character_id, created_at, updated_at"
+
+INSERT_MESSAGE_SQL = """INSERT INTO messages (message_id, conversation_id, role, name, content, character_id, created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Background writer batching: coalesce queued writes for up to this window,
+# then commit them together so fsync stays off the response path.
+WRITE_BATCH_MAX = 64
+WRITE_BATCH_WINDOW = 0.005
+
+# Per-conversation in-memory tail of recent messages, sized to cover the
+# LLM context window fetches without touching SQLite.
+MSG_TAIL_MAXLEN = 64
+
+# Idle window before pending audio-token updates are flushed; rapid updates
+# during generation collapse into one write per voice.
+TOKEN_FLUSH_DELAY = 0.1
+
+UPDATE_VOICE_TOKENS_SQL = "UPDATE voices SET audio_tokens = ?, updated_at = ? WHERE voice = ?"
+
+
 ########################################
 ##--          Data Models           --##
 ########################################
@@ -194,101 +318,242 @@ class DatabaseDirector:
 
     def __init__(self):
         self._character_cache: Dict[str, Character] = {}
-        self._voice_cache: Dict[str, Dict[str, Any]] = {}
+        self._voice_cache: Dict[str, Voice] = {}
+        # Reverse index voice -> character ids so voice rename/delete
+        # touches only the affected characters instead of scanning the cache.
+        self._voice_to_chars: Dict[str, Set[str]] = defaultdict(set)
         self._cache_loaded = False
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        # Newest messages per conversation; serves get_recent_messages /
+        # get_last_message without a SELECT once warm. Also covers messages
+        # still sitting in the write queue.
+        self._msg_tail: Dict[str, deque] = defaultdict(lambda: deque(maxlen=MSG_TAIL_MAXLEN))
+        # Write-through cache mirroring _character_cache/_voice_cache: every
+        # create/update path stores its result, so repeat get_conversation
+        # calls skip the SELECT.
+        self._conversation_cache: Dict[str, Conversation] = {}
+        # Latest-wins audio-token updates awaiting their debounced flush.
+        self._pending_tokens: Dict[str, Any] = {}
+        self._token_flush_task: Optional[asyncio.Task] = None
 
     async def init_database(self):
-        """Initialize database schema and load caches."""
-        async with aiosqlite.connect(DB_PATH) as conn:
-            await conn.executescript(SCHEMA_SQL)
-            await conn.commit()
+        """Open the shared connection, initialize schema, tune PRAGMAs, and load caches."""
+        # One long-lived connection: reconnecting per call spawns/joins
+        # aiosqlite's background thread, which dominates query cost here.
+        # Autocommit mode; multi-statement transactions take BEGIN IMMEDIATE
+        # explicitly so single-statement writes never wait on a deferred
+        # transaction upgrade.
+        # cached_statements sizes sqlite3's per-connection prepared-statement
+        # cache so the module-level SQL constants stay compiled across calls.
+        self._conn = await aiosqlite.connect(DB_PATH, isolation_level=None, cached_statements=256)
+        # Databases that predate message_count need the column (and a one-time
+        # backfill) before SCHEMA_SQL installs the counter triggers.
+        try:
+            await self._conn.execute(
+                "ALTER TABLE conversations ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0"
+            )
+            await self._conn.execute(
+                """UPDATE conversations SET message_count =
+                   (SELECT COUNT(*) FROM messages WHERE messages.conversation_id = conversations.conversation_id)"""
+            )
+        except aiosqlite.OperationalError:
+            pass  # fresh database or column already present
+        await self._conn.executescript(SCHEMA_SQL)
+        # WAL + relaxed sync: sub-ms writes, readers don't block behind writers.
+        # journal_mode/mmap_size persist in the database file; the rest are
+        # per-connection, applied here on the shared connection.
+        await self._conn.executescript(PRAGMA_SQL)
+        # Keep the name index in sync for databases that predate characters_fts
+        await self._conn.execute("INSERT INTO characters_fts(characters_fts) VALUES ('rebuild')")
         logger.info(f"SQLite database initialized at {DB_PATH}")
 
+        self._writer_task = asyncio.create_task(self._writer_loop())
         await self._load_caches()
 
+    async def _writer_loop(self):
+        """Drain queued (sql, params) writes in coalesced commits."""
+        while True:
+            batch = [await self._write_queue.get()]
+            try:
+                await asyncio.sleep(WRITE_BATCH_WINDOW)
+                while len(batch) < WRITE_BATCH_MAX and not self._write_queue.empty():
+                    batch.append(self._write_queue.get_nowait())
+
+                # Coalesce consecutive runs of the same statement into one
+                # executemany each. Runs — not a dict — so FIFO order holds
+                # across statements: a queued message insert must not jump
+                # ahead of the conversation insert it references.
+                runs: List[tuple] = []
+                for sql, params in batch:
+                    if runs and runs[-1][0] == sql:
+                        runs[-1][1].append(params)
+                    else:
+                        runs.append((sql, [params]))
+
+                try:
+                    async with self._write_lock:
+                        await self._conn.execute("BEGIN IMMEDIATE")
+                        try:
+                            for sql, rows in runs:
+                                await self._conn.executemany(sql, rows)
+                            await self._conn.execute("COMMIT")
+                        except BaseException:
+                            await self._conn.execute("ROLLBACK")
+                            raise
+                    logger.debug(f"Background writer committed {len(batch)} writes")
+                except Exception as e:
+                    # One bad write must not drop the whole batch — retry each
+                    # item on its own (autocommit) and log only the real culprit.
+                    logger.error(f"Background writer batch failed: {e}; retrying writes individually")
+                    for sql, params in batch:
+                        try:
+                            async with self._write_lock:
+                                await self._conn.execute(sql, params)
+                        except Exception as item_error:
+                            logger.error(f"Dropped background write: {item_error}")
+            except asyncio.CancelledError:
+                # Shutdown landed mid-batch. Anything dequeued but not yet
+                # committed (the transaction rolled back above) goes back on
+                # the queue so close()'s drain persists it.
+                for item in batch:
+                    self._write_queue.put_nowait(item)
+                raise
+
+    async def close(self):
+        """Flush pending writes and close the shared database connection."""
+        # Await the cancelled tasks so an in-flight transaction finishes its
+        # ROLLBACK before the drain below writes in autocommit.
+        for task in (self._writer_task, self._token_flush_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._writer_task = None
+        self._token_flush_task = None
+
+        if self._conn is not None:
+            # Drain the queue first: a pending token entry is always newer
+            # than any token UPDATE an earlier flush already queued, so it
+            # must be written last.
+            while not self._write_queue.empty():
+                sql, params = self._write_queue.get_nowait()
+                try:
+                    await self._conn.execute(sql, params)
+                except Exception as e:
+                    # A batch cancelled right after COMMIT re-queues already-
+                    # written rows; their re-insert fails on the primary key.
+                    logger.error(f"Dropped write during shutdown drain: {e}")
+            for voice_name, audio_tokens in self._pending_tokens.items():
+                await self._conn.execute(
+                    UPDATE_VOICE_TOKENS_SQL,
+                    (_pack_tokens(audio_tokens), _now(), voice_name)
+                )
+            self._pending_tokens.clear()
+            await self._conn.close()
+            self._conn = None
+
     async def _load_caches(self):
         """Load characters and voices into memory at startup."""
-        async with aiosqlite.connect(DB_PATH) as conn:
-            conn.row_factory = aiosqlite.Row
 
-            # Load all characters
-            cursor = await conn.execute("SELECT * FROM characters")
-            rows = await cursor.fetchall()
-            for row in rows:
-                character = self._row_to_character(row)
-                self._character_cache[character.id] = character
+        # Issue both queries up front so the voice statement is already
+        # prepared while character rows stream, then drain each cursor —
+        # model construction overlaps the worker-thread fetch throughout.
+        char_cursor = await self._conn.execute(f"SELECT {CHAR_COLS} FROM characters")
+        voice_cursor = await self._conn.execute(f"SELECT {VOICE_COLS} FROM voices")
 
-            # Load all voices
-            cursor = await conn.execute("SELECT * FROM voices")
-            rows = await cursor.fetchall()
-            for row in rows:
-                voice = self._row_to_voice(row)
-                self._voice_cache[voice.voice] = {
-                    "config": voice,
-                    "audio_tokens": voice.audio_tokens
-                }
+        async for row in char_cursor:
+            self._cache_character(self._row_to_character(row))
+        await char_cursor.close()
+
+        async for row in voice_cursor:
+            voice = self._row_to_voice(row)
+            self._voice_cache[voice.voice] = voice
+        await voice_cursor.close()
 
         self._cache_loaded = True
         logger.info(f"Loaded {len(self._character_cache)} characters and {len(self._voice_cache)} voices into cache")
 
-    def _row_to_character(self, row: aiosqlite.Row) -> Character:
-        """Convert database row to Character model."""
-        return Character(
-            id=row["id"],
-            name=row["name"],
-            voice=row["voice"] or "",
-            system_prompt=row["system_prompt"] or "",
-            image_url=row["image_url"] or "",
-            images=json.loads(row["images"]) if row["images"] else [],
-            is_active=bool(row["is_active"]),
-            last_message=row["last_message"] or "",
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
+    def _cache_character(self, character: Character):
+        """Insert/replace a cached character and keep the voice reverse index in sync."""
+        old = self._character_cache.get(character.id)
+        if old and old.voice and old.voice != character.voice:
+            self._voice_to_chars[old.voice].discard(character.id)
+        if character.voice:
+            self._voice_to_chars[character.voice].add(character.id)
+        self._character_cache[character.id] = character
+
+    def _evict_character(self, character_id: str):
+        """Remove a character from the cache and the voice reverse index."""
+        character = self._character_cache.pop(character_id, None)
+        if character and character.voice:
+            self._voice_to_chars[character.voice].discard(character_id)
+
+    def _row_to_character(self, row: tuple) -> Character:
+        """Convert a CHAR_COLS-ordered row to a Character model."""
+        character_id, name, voice, system_prompt, image_url, images, is_active, last_message, created_at, updated_at = row
+        return Character.model_construct(
+            id=character_id,
+            name=name,
+            voice=voice or "",
+            system_prompt=system_prompt or "",
+            image_url=image_url or "",
+            images=_loads(images) if images else [],
+            is_active=bool(is_active),
+            last_message=last_message or "",
+            created_at=created_at,
+            updated_at=updated_at
         )
 
-    def _row_to_voice(self, row: aiosqlite.Row) -> Voice:
-        """Convert database row to Voice model."""
-        audio_tokens = None
-        if row["audio_tokens"]:
+    def _row_to_voice(self, row: tuple) -> Voice:
+        """Convert a VOICE_COLS-ordered row to a Voice model."""
+        voice, method, audio_path, text_path, speaker_desc, scene_prompt, audio_tokens, voice_id, created_at, updated_at = row
+        if audio_tokens:
             try:
-                audio_tokens = json.loads(row["audio_tokens"])
-            except (json.JSONDecodeError, TypeError):
-                audio_tokens = row["audio_tokens"]
-
-        return Voice(
-            voice=row["voice"],
-            method=row["method"] or "",
-            audio_path=row["audio_path"] or "",
-            text_path=row["text_path"] or "",
-            speaker_desc=row["speaker_desc"] or "",
-            scene_prompt=row["scene_prompt"] or "",
+                audio_tokens = _unpack_tokens(audio_tokens)
+            except (_JSONDecodeError, TypeError, ValueError):
+                pass
+
+        return Voice.model_construct(
+            voice=voice,
+            method=method or "",
+            audio_path=audio_path or "",
+            text_path=text_path or "",
+            speaker_desc=speaker_desc or "",
+            scene_prompt=scene_prompt or "",
             audio_tokens=audio_tokens,
-            id=row["id"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
+            id=voice_id,
+            created_at=created_at,
+            updated_at=updated_at
         )
 
-    def _row_to_conversation(self, row: aiosqlite.Row) -> Conversation:
-        """Convert database row to Conversation model."""
-        return Conversation(
-            conversation_id=row["conversation_id"],
-            title=row["title"],
-            active_characters=json.loads(row["active_characters"]) if row["active_characters"] else [],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
+    def _row_to_conversation(self, row: tuple) -> Conversation:
+        """Convert a CONV_COLS-ordered row to a Conversation model."""
+        conversation_id, title, active_characters, created_at, updated_at = row
+        return Conversation.model_construct(
+            conversation_id=conversation_id,
+            title=title,
+            active_characters=_unpack_chars(active_characters) if active_characters else [],
+            created_at=created_at,
+            updated_at=updated_at
         )
 
-    def _row_to_message(self, row: aiosqlite.Row) -> Message:
-        """Convert database row to Message model."""
-        return Message(
-            message_id=row["message_id"],
-            conversation_id=row["conversation_id"],
-            role=row["role"],
-            name=row["name"],
-            content=row["content"],
-            character_id=row["character_id"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
+    def _row_to_message(self, row: tuple) -> Message:
+        """Convert a MSG_COLS-ordered row to a Message model."""
+        message_id, conversation_id, role, name, content, character_id, created_at, updated_at = row
+        return Message.model_construct(
+            message_id=message_id,
+            conversation_id=conversation_id,
+            role=role,
+            name=name,
+            content=content,
+            character_id=character_id,
+            created_at=created_at,
+            updated_at=updated_at
         )
 
     ########################################
@@ -298,32 +563,27 @@ class DatabaseDirector:
     async def _generate_character_id(self, name: str) -> str:
         """Generate a sequential ID from the character name."""
         base_id = name.lower().strip()
-        base_id = re.sub(r'[^a-z0-9\s-]', '', base_id)
-        base_id = re.sub(r'\s+', '-', base_id)
-        base_id = re.sub(r'-+', '-', base_id)
+        base_id = _RE_NONALNUM.sub('', base_id)
+        base_id = _RE_WS.sub('-', base_id)
+        base_id = _RE_DASHES.sub('-', base_id)
         base_id = base_id.strip('-')
 
         if not base_id:
             base_id = "character"
 
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                cursor = await conn.execute(
-                    "SELECT id FROM characters WHERE id LIKE ?",
-                    (f"{base_id}-%",)
-                )
-                rows = await cursor.fetchall()
-
-            highest_num = 0
-            pattern = re.compile(rf"^{re.escape(base_id)}-(\d{{3}})$")
-
-            for row in rows:
-                match = pattern.match(row[0])
-                if match:
-                    num = int(match.group(1))
-                    highest_num = max(highest_num, num)
+            # Let SQLite find the highest numeric suffix in one indexed
+            # range scan instead of regex-matching every row in Python.
+            suffix_start = len(base_id) + 2
+            cursor = await self._conn.execute(
+                """SELECT COALESCE(MAX(CAST(substr(id, ?) AS INTEGER)), 0)
+                   FROM characters
+                   WHERE id LIKE ? AND substr(id, ?) GLOB '[0-9][0-9][0-9]'""",
+                (suffix_start, f"{base_id}-%", suffix_start)
+            )
+            row = await cursor.fetchone()
 
-            next_num = highest_num + 1
+            next_num = (row[0] if row else 0) + 1
             character_id = f"{base_id}-{next_num:03d}"
 
             logger.info(f"Generated character id: {character_id}")
@@ -342,10 +602,8 @@ class DatabaseDirector:
 
         # Fallback to database if cache not loaded
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute("SELECT * FROM characters")
-                rows = await cursor.fetchall()
+            cursor = await self._conn.execute(f"SELECT {CHAR_COLS} FROM characters")
+            rows = await cursor.fetchall()
 
             characters = [self._row_to_character(row) for row in rows]
             logger.info(f"Retrieved {len(characters)} characters from database")
@@ -363,10 +621,8 @@ class DatabaseDirector:
             return characters
 
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute("SELECT * FROM characters WHERE is_active = 1")
-                rows = await cursor.fetchall()
+            cursor = await self._conn.execute(f"SELECT {CHAR_COLS} FROM characters WHERE is_active = 1")
+            rows = await cursor.fetchall()
 
             characters = [self._row_to_character(row) for row in rows]
             logger.info(f"Retrieved {len(characters)} active characters from database")
@@ -382,13 +638,11 @@ class DatabaseDirector:
             return self._character_cache[character_id]
 
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(
-                    "SELECT * FROM characters WHERE id = ?",
-                    (character_id,)
-                )
-                row = await cursor.fetchone()
+            cursor = await self._conn.execute(
+                f"SELECT {CHAR_COLS} FROM characters WHERE id = ?",
+                (character_id,)
+            )
+            row = await cursor.fetchone()
 
             if not row:
                 raise HTTPException(status_code=404, detail="Character not found")
@@ -401,44 +655,25 @@ class DatabaseDirector:
             logger.error(f"Error getting character {character_id}: {e}")
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
-    async def _get_character_from_db(self, character_id: str) -> Character:
-        """Get a specific character directly from the database."""
-        try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(
-                    "SELECT * FROM characters WHERE id = ?",
-                    (character_id,)
-                )
-                row = await cursor.fetchone()
-
-            if not row:
-                raise HTTPException(status_code=404, detail="Character not found")
-
-            return self._row_to_character(row)
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Error getting character {character_id} from DB: {e}")
-            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    def get_active_characters_sync(self) -> List[Character]:
+        """Cache-only active-character list for hot paths — no event-loop hop."""
+        return [c for c in self._character_cache.values() if c.is_active]
 
     async def create_character(self, character_data: CharacterCreate) -> Character:
         """Create a new character."""
         try:
             character_id = await self._generate_character_id(character_data.name)
-            now = datetime.now().isoformat()
+            now = _now()
 
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
+            async with self._write_lock:
+                await self._conn.execute(
                     """INSERT INTO characters (id, name, voice, system_prompt, image_url, images, is_active, created_at, updated_at)
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                     (character_id, character_data.name, character_data.voice,
                      character_data.system_prompt, character_data.image_url,
-                     json.dumps(character_data.images), 1 if character_data.is_active else 0,
+                     _dumps(character_data.images), 1 if character_data.is_active else 0,
                      now, now)
                 )
-                await conn.commit()
 
             character = Character(
                 id=character_id,
@@ -453,7 +688,7 @@ class DatabaseDirector:
                 updated_at=now
             )
 
-            self._character_cache[character_id] = character
+            self._cache_character(character)
             logger.info(f"Created character: {character_id}")
             return character
 
@@ -464,49 +699,33 @@ class DatabaseDirector:
     async def update_character(self, character_id: str, character_data: CharacterUpdate) -> Character:
         """Update an existing character."""
         try:
-            await self.get_character(character_id)
-
-            updates = []
-            params = []
-
-            if character_data.name is not None:
-                updates.append("name = ?")
-                params.append(character_data.name)
-            if character_data.voice is not None:
-                updates.append("voice = ?")
-                params.append(character_data.voice)
-            if character_data.system_prompt is not None:
-                updates.append("system_prompt = ?")
-                params.append(character_data.system_prompt)
-            if character_data.image_url is not None:
-                updates.append("image_url = ?")
-                params.append(character_data.image_url)
-            if character_data.images is not None:
-                updates.append("images = ?")
-                params.append(json.dumps(character_data.images))
-            if character_data.is_active is not None:
-                updates.append("is_active = ?")
-                params.append(1 if character_data.is_active else 0)
-            if character_data.last_message is not None:
-                updates.append("last_message = ?")
-                params.append(character_data.last_message)
+            # exclude_unset yields exactly the submitted fields (PATCH semantics)
+            submitted = character_data.model_dump(exclude_unset=True)
 
-            if not updates:
+            if not submitted:
                 raise HTTPException(status_code=400, detail="No fields to update")
 
-            updates.append("updated_at = ?")
-            params.append(datetime.now().isoformat())
-            params.append(character_id)
+            if submitted.get("images") is not None:
+                submitted["images"] = _dumps(submitted["images"])
+            if submitted.get("is_active") is not None:
+                submitted["is_active"] = int(submitted["is_active"])
+
+            cols = list(submitted)
+            set_sql = ", ".join(f"{col} = ?" for col in cols) + ", updated_at = ?"
+            params = [submitted[col] for col in cols] + [_now(), character_id]
 
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
-                    f"UPDATE characters SET {', '.join(updates)} WHERE id = ?",
+            async with self._write_lock:
+                cursor = await self._conn.execute(
+                    f"UPDATE characters SET {set_sql} WHERE id = ? RETURNING {CHAR_COLS}",
                     params
                 )
-                await conn.commit()
+                row = await cursor.fetchone()
+
+            if not row:
+                raise HTTPException(status_code=404, detail="Character not found")
 
-            character = await self._get_character_from_db(character_id)
-            self._character_cache[character_id] = character
+            character = self._row_to_character(row)
+            self._cache_character(character)
             logger.info(f"Updated character: {character_id}")
             return character
 
@@ -523,14 +742,17 @@ class DatabaseDirector:
     async def delete_character(self, character_id: str) -> bool:
         """Delete a character."""
         try:
-            await self.get_character(character_id)
+            async with self._write_lock:
+                cursor = await self._conn.execute(
+                    "DELETE FROM characters WHERE id = ? RETURNING id",
+                    (character_id,)
+                )
+                row = await cursor.fetchone()
 
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute("DELETE FROM characters WHERE id = ?", (character_id,))
-                await conn.commit()
+            if not row:
+                raise HTTPException(status_code=404, detail="Character not found")
 
-            if character_id in self._character_cache:
-                del self._character_cache[character_id]
+            self._evict_character(character_id)
 
             logger.info(f"Deleted character: {character_id}")
             return True
@@ -550,13 +772,15 @@ class DatabaseDirector:
             return characters
 
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(
-                    "SELECT * FROM characters WHERE name LIKE ?",
-                    (f"%{query}%",)
-                )
-                rows = await cursor.fetchall()
+            # Prefix match against the FTS5 name index instead of an
+            # unindexable LIKE '%query%' full scan.
+            match = '"' + query.replace('"', '""') + '"*'
+            cursor = await self._conn.execute(
+                f"""SELECT {CHAR_COLS} FROM characters
+                    WHERE id IN (SELECT id FROM characters_fts WHERE characters_fts MATCH ?)""",
+                (match,)
+            )
+            rows = await cursor.fetchall()
 
             characters = [self._row_to_character(row) for row in rows]
             logger.info(f"Found {len(characters)} characters matching '{query}'")
@@ -569,13 +793,10 @@ class DatabaseDirector:
     async def refresh_character_cache(self):
         """Reload character cache from database."""
         self._character_cache.clear()
-        async with aiosqlite.connect(DB_PATH) as conn:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute("SELECT * FROM characters")
-            rows = await cursor.fetchall()
-            for row in rows:
-                character = self._row_to_character(row)
-                self._character_cache[character.id] = character
+        self._voice_to_chars.clear()
+        async with self._conn.execute(f"SELECT {CHAR_COLS} FROM characters") as cursor:
+            async for row in cursor:
+                self._cache_character(self._row_to_character(row))
         logger.info(f"Refreshed character cache: {len(self._character_cache)} characters")
 
     ########################################
@@ -585,15 +806,13 @@ class DatabaseDirector:
     async def get_all_voices(self) -> List[Voice]:
         """Get all voices from cache."""
         if self._cache_loaded:
-            voices = [v["config"] for v in self._voice_cache.values()]
+            voices = list(self._voice_cache.values())
             logger.info(f"Retrieved {len(voices)} voices from cache")
             return voices
 
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute("SELECT * FROM voices")
-                rows = await cursor.fetchall()
+            cursor = await self._conn.execute(f"SELECT {VOICE_COLS} FROM voices")
+            rows = await cursor.fetchall()
 
             voices = [self._row_to_voice(row) for row in rows]
             logger.info(f"Retrieved {len(voices)} voices from database")
@@ -607,26 +826,21 @@ class DatabaseDirector:
         """Get a specific voice by name."""
         if self._cache_loaded and voice_name in self._voice_cache:
             logger.debug(f"Retrieved voice {voice_name} from cache")
-            return self._voice_cache[voice_name]["config"]
+            return self._voice_cache[voice_name]
 
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(
-                    "SELECT * FROM voices WHERE voice = ?",
-                    (voice_name,)
-                )
-                row = await cursor.fetchone()
+            cursor = await self._conn.execute(
+                f"SELECT {VOICE_COLS} FROM voices WHERE voice = ?",
+                (voice_name,)
+            )
+            row = await cursor.fetchone()
 
             if not row:
                 raise HTTPException(status_code=404, detail="Voice not found")
 
             voice = self._row_to_voice(row)
 
-            self._voice_cache[voice_name] = {
-                "config": voice,
-                "audio_tokens": voice.audio_tokens
-            }
+            self._voice_cache[voice_name] = voice
 
             logger.info(f"Retrieved voice {voice_name} from database")
             return voice
@@ -647,18 +861,17 @@ class DatabaseDirector:
             if self._cache_loaded and voice_name in self._voice_cache:
                 raise HTTPException(status_code=400, detail="Voice name already exists")
 
-            now = datetime.now().isoformat()
+            now = _now()
             voice_id = str(uuid.uuid4())
 
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
+            async with self._write_lock:
+                await self._conn.execute(
                     """INSERT INTO voices (voice, method, audio_path, text_path, speaker_desc, scene_prompt, id, created_at, updated_at)
                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                     (voice_name, voice_data.method, voice_data.audio_path,
                      voice_data.text_path, voice_data.speaker_desc, voice_data.scene_prompt,
                      voice_id, now, now)
                 )
-                await conn.commit()
 
             voice = Voice(
                 voice=voice_name,
@@ -673,10 +886,7 @@ class DatabaseDirector:
                 updated_at=now
             )
 
-            self._voice_cache[voice_name] = {
-                "config": voice,
-                "audio_tokens": None
-            }
+            self._voice_cache[voice_name] = voice
 
             logger.info(f"Created voice: {voice.voice}")
             return voice
@@ -688,76 +898,57 @@ class DatabaseDirector:
     async def update_voice(self, voice_name: str, voice_data: VoiceUpdate) -> Voice:
         """Update an existing voice."""
         try:
-            await self.get_voice(voice_name)
-
-            new_voice = (voice_data.new_voice or "").strip() if voice_data.new_voice is not None else None
-            updates = []
-            params = []
-
-            if new_voice:
+            # exclude_unset yields exactly the submitted fields (PATCH semantics)
+            submitted = voice_data.model_dump(exclude_unset=True)
+
+            new_voice = None
+            if "new_voice" in submitted:
+                new_voice = (submitted.pop("new_voice") or "").strip()
+                if not new_voice:
+                    raise HTTPException(status_code=400, detail="New voice name required")
                 if new_voice != voice_name:
-                    updates.append("voice = ?")
-                    params.append(new_voice)
-            elif voice_data.new_voice is not None:
-                raise HTTPException(status_code=400, detail="New voice name required")
-
-            if voice_data.method is not None:
-                updates.append("method = ?")
-                params.append(voice_data.method)
-            if voice_data.audio_path is not None:
-                updates.append("audio_path = ?")
-                params.append(voice_data.audio_path)
-            if voice_data.text_path is not None:
-                updates.append("text_path = ?")
-                params.append(voice_data.text_path)
-            if voice_data.speaker_desc is not None:
-                updates.append("speaker_desc = ?")
-                params.append(voice_data.speaker_desc)
-            if voice_data.scene_prompt is not None:
-                updates.append("scene_prompt = ?")
-                params.append(voice_data.scene_prompt)
-            if voice_data.audio_tokens is not None:
-                updates.append("audio_tokens = ?")
-                params.append(json.dumps(voice_data.audio_tokens))
+                    submitted = {"voice": new_voice, **submitted}
 
-            if not updates:
+            if not submitted:
                 raise HTTPException(status_code=400, detail="No fields to update")
 
-            now = datetime.now().isoformat()
-            updates.append("updated_at = ?")
-            params.append(now)
-            params.append(voice_name)
+            if submitted.get("audio_tokens") is not None:
+                submitted["audio_tokens"] = _pack_tokens(submitted["audio_tokens"])
 
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
+            now = _now()
+            cols = list(submitted)
+            set_sql = ", ".join(f"{col} = ?" for col in cols) + ", updated_at = ?"
+            params = [submitted[col] for col in cols] + [now, voice_name]
 
+            # Rename + character cascade is a multi-statement transaction,
+            # so serialize it on the shared connection.
+            async with self._write_lock:
                 if new_voice and new_voice != voice_name:
-                    cursor = await conn.execute(
+                    cursor = await self._conn.execute(
                         "SELECT voice FROM voices WHERE voice = ?",
                         (new_voice,)
                     )
                     if await cursor.fetchone():
                         raise HTTPException(status_code=400, detail="Voice name already exists")
 
-                await conn.execute(
-                    f"UPDATE voices SET {', '.join(updates)} WHERE voice = ?",
-                    params
-                )
-
-                if new_voice and new_voice != voice_name:
-                    await conn.execute(
-                        "UPDATE characters SET voice = ?, updated_at = ? WHERE voice = ?",
-                        (new_voice, now, voice_name)
+                await self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor = await self._conn.execute(
+                        f"UPDATE voices SET {set_sql} WHERE voice = ? RETURNING {VOICE_COLS}",
+                        params
                     )
+                    row = await cursor.fetchone()
 
-                await conn.commit()
+                    if new_voice and new_voice != voice_name:
+                        await self._conn.execute(
+                            "UPDATE characters SET voice = ?, updated_at = ? WHERE voice = ?",
+                            (new_voice, now, voice_name)
+                        )
 
-                updated_voice_name = new_voice if new_voice and new_voice != voice_name else voice_name
-                cursor = await conn.execute(
-                    "SELECT * FROM voices WHERE voice = ?",
-                    (updated_voice_name,)
-                )
-                row = await cursor.fetchone()
+                    await self._conn.execute("COMMIT")
+                except BaseException:
+                    await self._conn.execute("ROLLBACK")
+                    raise
 
             if not row:
                 raise HTTPException(status_code=404, detail="Voice not found")
@@ -767,16 +958,16 @@ class DatabaseDirector:
             if new_voice and new_voice != voice_name and voice_name in self._voice_cache:
                 del self._voice_cache[voice_name]
 
-            self._voice_cache[voice.voice] = {
-                "config": voice,
-                "audio_tokens": voice.audio_tokens
-            }
+            self._voice_cache[voice.voice] = voice
 
             if new_voice and new_voice != voice_name and self._cache_loaded:
-                for character in self._character_cache.values():
-                    if character.voice == voice_name:
-                        character.voice = new_voice
-                        character.updated_at = now
+                for character_id in self._voice_to_chars.pop(voice_name, set()):
+                    character = self._character_cache.get(character_id)
+                    if character:
+                        self._character_cache[character_id] = character.model_copy(
+                            update={"voice": new_voice, "updated_at": now}
+                        )
+                        self._voice_to_chars[new_voice].add(character_id)
 
             logger.info(f"Updated voice: {voice.voice}")
             return voice
@@ -790,25 +981,40 @@ class DatabaseDirector:
     async def delete_voice(self, voice_name: str) -> bool:
         """Delete a voice."""
         try:
-            await self.get_voice(voice_name)
-
-            async with aiosqlite.connect(DB_PATH) as conn:
-                now = datetime.now().isoformat()
-                await conn.execute("DELETE FROM voices WHERE voice = ?", (voice_name,))
-                await conn.execute(
-                    "UPDATE characters SET voice = '', updated_at = ? WHERE voice = ?",
-                    (now, voice_name)
-                )
-                await conn.commit()
+            now = _now()
+            async with self._write_lock:
+                await self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor = await self._conn.execute(
+                        "DELETE FROM voices WHERE voice = ? RETURNING voice",
+                        (voice_name,)
+                    )
+                    row = await cursor.fetchone()
+
+                    # No voice, no side effects: roll back before the
+                    # character cascade can touch anything.
+                    if not row:
+                        raise HTTPException(status_code=404, detail="Voice not found")
+
+                    await self._conn.execute(
+                        "UPDATE characters SET voice = '', updated_at = ? WHERE voice = ?",
+                        (now, voice_name)
+                    )
+                    await self._conn.execute("COMMIT")
+                except BaseException:
+                    await self._conn.execute("ROLLBACK")
+                    raise
 
             if voice_name in self._voice_cache:
                 del self._voice_cache[voice_name]
 
             if self._cache_loaded:
-                for character in self._character_cache.values():
-                    if character.voice == voice_name:
-                        character.voice = ""
-                        character.updated_at = now
+                for character_id in self._voice_to_chars.pop(voice_name, set()):
+                    character = self._character_cache.get(character_id)
+                    if character:
+                        self._character_cache[character_id] = character.model_copy(
+                            update={"voice": "", "updated_at": now}
+                        )
 
             logger.info(f"Deleted voice: {voice_name}")
             return True
@@ -821,28 +1027,30 @@ class DatabaseDirector:
 
     def get_cached_audio_tokens(self, voice_name: str) -> Optional[Any]:
         """Get audio tokens from cache if available."""
-        if voice_name in self._voice_cache:
-            return self._voice_cache[voice_name]["audio_tokens"]
-        return None
+        voice = self._voice_cache.get(voice_name)
+        return voice.audio_tokens if voice else None
 
     def update_cached_audio_tokens(self, voice_name: str, audio_tokens: Any):
-        """Update audio tokens in cache and persist to database in background."""
-        if voice_name in self._voice_cache:
-            self._voice_cache[voice_name]["audio_tokens"] = audio_tokens
-            asyncio.create_task(self._persist_audio_tokens(voice_name, audio_tokens))
-
-    async def _persist_audio_tokens(self, voice_name: str, audio_tokens: Any):
-        """Background task to persist audio tokens to database."""
-        try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
-                    "UPDATE voices SET audio_tokens = ?, updated_at = ? WHERE voice = ?",
-                    (json.dumps(audio_tokens), datetime.now().isoformat(), voice_name)
-                )
-                await conn.commit()
-            logger.debug(f"Persisted audio tokens for voice: {voice_name}")
-        except Exception as e:
-            logger.error(f"Failed to persist audio tokens for {voice_name}: {e}")
+        """Update audio tokens in cache and persist the latest value after a short idle window."""
+        voice = self._voice_cache.get(voice_name)
+        if voice:
+            self._voice_cache[voice_name] = voice.model_copy(update={"audio_tokens": audio_tokens})
+            # Debounce: overwrite the pending entry so rapid updates during
+            # generation become one packed write per voice, not N.
+            self._pending_tokens[voice_name] = audio_tokens
+            if self._token_flush_task is None or self._token_flush_task.done():
+                self._token_flush_task = asyncio.create_task(self._flush_pending_tokens())
+
+    async def _flush_pending_tokens(self):
+        """Hand the latest pending audio tokens per voice to the background writer."""
+        await asyncio.sleep(TOKEN_FLUSH_DELAY)
+        pending, self._pending_tokens = self._pending_tokens, {}
+        now = _now()
+        for voice_name, audio_tokens in pending.items():
+            self._write_queue.put_nowait((
+                UPDATE_VOICE_TOKENS_SQL,
+                (_pack_tokens(audio_tokens), now, voice_name)
+            ))
 
     def clear_voice_cache(self):
         """Clear the voice cache."""
@@ -852,16 +1060,10 @@ class DatabaseDirector:
     async def refresh_voice_cache(self):
         """Reload voice cache from database."""
         self._voice_cache.clear()
-        async with aiosqlite.connect(DB_PATH) as conn:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute("SELECT * FROM voices")
-            rows = await cursor.fetchall()
-            for row in rows:
+        async with self._conn.execute(f"SELECT {VOICE_COLS} FROM voices") as cursor:
+            async for row in cursor:
                 voice = self._row_to_voice(row)
-                self._voice_cache[voice.voice] = {
-                    "config": voice,
-                    "audio_tokens": voice.audio_tokens
-                }
+                self._voice_cache[voice.voice] = voice
         logger.info(f"Refreshed voice cache: {len(self._voice_cache)} voices")
 
     ########################################
@@ -885,20 +1087,19 @@ class DatabaseDirector:
         """Create a new conversation."""
         try:
             conversation_id = str(uuid.uuid4())
-            now = datetime.now().isoformat()
+            now = _now()
 
             title = conversation_data.title
             if auto_generate_title and not title:
                 title = self._generate_conversation_title()
 
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
+            async with self._write_lock:
+                await self._conn.execute(
                     """INSERT INTO conversations (conversation_id, title, active_characters, created_at, updated_at)
                        VALUES (?, ?, ?, ?, ?)""",
-                    (conversation_id, title, json.dumps(conversation_data.active_characters or []),
+                    (conversation_id, title, _pack_chars(conversation_data.active_characters or []),
                      now, now)
                 )
-                await conn.commit()
 
             conversation = Conversation(
                 conversation_id=conversation_id,
@@ -908,6 +1109,7 @@ class DatabaseDirector:
                 updated_at=now
             )
 
+            self._conversation_cache[conversation_id] = conversation
             logger.info(f"Created conversation {conversation.conversation_id}")
             return conversation
 
@@ -916,44 +1118,44 @@ class DatabaseDirector:
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
     async def create_conversation_background(self, conversation_data: ConversationCreate) -> str:
-        """Create conversation in background, return ID immediately."""
+        """Queue conversation creation on the background writer, return ID immediately."""
         conversation_id = str(uuid.uuid4())
-        asyncio.create_task(self._create_conversation_async(conversation_id, conversation_data))
+        now = _now()
+        title = conversation_data.title or self._generate_conversation_title()
+        self._write_queue.put_nowait((
+            """INSERT INTO conversations (conversation_id, title, active_characters, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?)""",
+            (conversation_id, title, _pack_chars(conversation_data.active_characters or []),
+             now, now)
+        ))
+        self._conversation_cache[conversation_id] = Conversation.model_construct(
+            conversation_id=conversation_id,
+            title=title,
+            active_characters=conversation_data.active_characters or [],
+            created_at=now,
+            updated_at=now
+        )
         return conversation_id
 
-    async def _create_conversation_async(self, conversation_id: str, conversation_data: ConversationCreate):
-        """Background task to create conversation."""
-        try:
-            now = datetime.now().isoformat()
-            title = conversation_data.title or self._generate_conversation_title()
-
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
-                    """INSERT INTO conversations (conversation_id, title, active_characters, created_at, updated_at)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (conversation_id, title, json.dumps(conversation_data.active_characters or []),
-                     now, now)
-                )
-                await conn.commit()
-            logger.debug(f"Background created conversation: {conversation_id}")
-        except Exception as e:
-            logger.error(f"Background conversation creation failed: {e}")
-
     async def get_conversation(self, conversation_id: str) -> Conversation:
         """Get a specific conversation by ID."""
+        cached = self._conversation_cache.get(conversation_id)
+        if cached is not None:
+            return cached
+
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(
-                    "SELECT * FROM conversations WHERE conversation_id = ?",
-                    (conversation_id,)
-                )
-                row = await cursor.fetchone()
+            cursor = await self._conn.execute(
+                f"SELECT {CONV_COLS} FROM conversations WHERE conversation_id = ?",
+                (conversation_id,)
+            )
+            row = await cursor.fetchone()
 
             if not row:
                 raise HTTPException(status_code=404, detail="Conversation not found")
 
-            return self._row_to_conversation(row)
+            conversation = self._row_to_conversation(row)
+            self._conversation_cache[conversation_id] = conversation
+            return conversation
 
         except HTTPException:
             raise
@@ -964,21 +1166,31 @@ class DatabaseDirector:
     async def get_all_conversations(
         self,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        before_updated_at: Optional[str] = None,
+        before_id: Optional[str] = None
     ) -> List[Conversation]:
-        """Get all conversations ordered by most recent first."""
+        """Get conversations ordered by most recent first.
+
+        Pass the last row's (updated_at, conversation_id) as
+        before_updated_at/before_id for keyset pagination — each page is then
+        an index seek, where OFFSET re-scans every skipped row.
+        """
         try:
-            query = "SELECT * FROM conversations ORDER BY updated_at DESC"
+            query = f"SELECT {CONV_COLS} FROM conversations"
             params = []
 
+            if before_updated_at is not None and before_id is not None:
+                query += " WHERE (updated_at, conversation_id) < (?, ?)"
+                params.extend([before_updated_at, before_id])
+
+            query += " ORDER BY updated_at DESC, conversation_id DESC"
+
             if limit is not None:
                 query += " LIMIT ? OFFSET ?"
                 params.extend([limit, offset])
-
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(query, params)
-                rows = await cursor.fetchall()
+            cursor = await self._conn.execute(query, params)
+            rows = await cursor.fetchall()
 
             conversations = [self._row_to_conversation(row) for row in rows]
             logger.info(f"Retrieved {len(conversations)} conversations")
@@ -1003,27 +1215,30 @@ class DatabaseDirector:
                 params.append(conversation_data.title)
             if conversation_data.active_characters is not None:
                 updates.append("active_characters = ?")
-                params.append(json.dumps(conversation_data.active_characters))
+                params.append(_pack_chars(conversation_data.active_characters))
 
             if not updates:
                 raise HTTPException(status_code=400, detail="No fields to update")
 
             updates.append("updated_at = ?")
-            params.append(datetime.now().isoformat())
+            params.append(_now())
             params.append(conversation_id)
 
-            async with aiosqlite.connect(DB_PATH) as conn:
-                cursor = await conn.execute(
-                    f"UPDATE conversations SET {', '.join(updates)} WHERE conversation_id = ?",
+            async with self._write_lock:
+                cursor = await self._conn.execute(
+                    f"UPDATE conversations SET {', '.join(updates)} WHERE conversation_id = ? "
+                    f"RETURNING {CONV_COLS}",
                     params
                 )
-                await conn.commit()
+                row = await cursor.fetchone()
 
-                if cursor.rowcount == 0:
-                    raise HTTPException(status_code=404, detail="Conversation not found")
+            if not row:
+                raise HTTPException(status_code=404, detail="Conversation not found")
 
+            conversation = self._row_to_conversation(row)
+            self._conversation_cache[conversation_id] = conversation
             logger.info(f"Updated conversation {conversation_id}")
-            return await self.get_conversation(conversation_id)
+            return conversation
 
         except HTTPException:
             raise
@@ -1046,6 +1261,41 @@ class DatabaseDirector:
             ConversationUpdate(active_characters=active_characters)
         )
 
+    async def _update_active_characters(
+        self,
+        conversation_id: str,
+        mutate
+    ) -> Conversation:
+        """Fetch active_characters, apply mutate(list) -> list, write back atomically.
+
+        The read-modify-write runs under the write lock in one transaction so
+        two concurrent toggles can't lose each other's update.
+        """
+        async with self._write_lock:
+            await self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = await self._conn.execute(
+                    "SELECT active_characters FROM conversations WHERE conversation_id = ?",
+                    (conversation_id,)
+                )
+                row = await cursor.fetchone()
+                if not row:
+                    raise HTTPException(status_code=404, detail="Conversation not found")
+
+                active_characters = mutate(_unpack_chars(row[0]))
+                cursor = await self._conn.execute(
+                    f"UPDATE conversations SET active_characters = ?, updated_at = ? "
+                    f"WHERE conversation_id = ? RETURNING {CONV_COLS}",
+                    (_pack_chars(active_characters), _now(), conversation_id)
+                )
+                conversation = self._row_to_conversation(await cursor.fetchone())
+                await self._conn.execute("COMMIT")
+                self._conversation_cache[conversation_id] = conversation
+                return conversation
+            except BaseException:
+                await self._conn.execute("ROLLBACK")
+                raise
+
     async def add_character_to_conversation(
         self,
         conversation_id: str,
@@ -1053,15 +1303,15 @@ class DatabaseDirector:
     ) -> Conversation:
         """Add a character to the conversation's active_characters list."""
         try:
-            conversation = await self.get_conversation(conversation_id)
+            def add(chars):
+                if character_data.get("id") not in (c.get("id") for c in chars):
+                    chars.append(character_data)
+                return chars
 
-            character_ids = [c.get("id") for c in conversation.active_characters]
-            if character_data.get("id") not in character_ids:
-                active_characters = conversation.active_characters + [character_data]
-                return await self.update_conversation_active_characters(conversation_id, active_characters)
-
-            return conversation
+            return await self._update_active_characters(conversation_id, add)
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error adding character to conversation {conversation_id}: {e}")
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -1073,10 +1323,13 @@ class DatabaseDirector:
     ) -> Conversation:
         """Remove a character from the conversation's active_characters list."""
         try:
-            conversation = await self.get_conversation(conversation_id)
-            active_characters = [c for c in conversation.active_characters if c.get("id") != character_id]
-            return await self.update_conversation_active_characters(conversation_id, active_characters)
+            return await self._update_active_characters(
+                conversation_id,
+                lambda chars: [c for c in chars if c.get("id") != character_id]
+            )
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error removing character from conversation {conversation_id}: {e}")
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -1084,17 +1337,17 @@ class DatabaseDirector:
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation (messages will be cascade deleted)."""
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute("PRAGMA foreign_keys = ON")
-                cursor = await conn.execute(
+            async with self._write_lock:
+                cursor = await self._conn.execute(
                     "DELETE FROM conversations WHERE conversation_id = ?",
                     (conversation_id,)
                 )
-                await conn.commit()
 
-                if cursor.rowcount == 0:
-                    raise HTTPException(status_code=404, detail="Conversation not found")
+            if cursor.rowcount == 0:
+                raise HTTPException(status_code=404, detail="Conversation not found")
 
+            self._conversation_cache.pop(conversation_id, None)
+            self._msg_tail.pop(conversation_id, None)
             logger.info(f"Deleted conversation {conversation_id}")
             return True
 
@@ -1131,17 +1384,15 @@ class DatabaseDirector:
         """Create a single message."""
         try:
             message_id = str(uuid.uuid4())
-            now = datetime.now().isoformat()
+            now = _now()
 
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
-                    """INSERT INTO messages (message_id, conversation_id, role, name, content, character_id, created_at, updated_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            async with self._write_lock:
+                await self._conn.execute(
+                    INSERT_MESSAGE_SQL,
                     (message_id, message_data.conversation_id, message_data.role,
                      message_data.name, message_data.content, message_data.character_id,
                      now, now)
                 )
-                await conn.commit()
 
             message = Message(
                 message_id=message_id,
@@ -1154,6 +1405,7 @@ class DatabaseDirector:
                 updated_at=now
             )
 
+            self._msg_tail[message.conversation_id].append(message)
             logger.info(f"Created message {message.message_id} in conversation {message.conversation_id}")
             return message
 
@@ -1162,54 +1414,61 @@ class DatabaseDirector:
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
     def create_message_background(self, message_data: MessageCreate) -> str:
-        """Create message in background (fire-and-forget). Returns message_id immediately."""
+        """Queue message for the background writer (fire-and-forget). Returns message_id immediately."""
         message_id = str(uuid.uuid4())
-        asyncio.create_task(self._create_message_async(message_id, message_data))
+        now = _now()
+        self._write_queue.put_nowait((
+            INSERT_MESSAGE_SQL,
+            (message_id, message_data.conversation_id, message_data.role,
+             message_data.name, message_data.content, message_data.character_id,
+             now, now)
+        ))
+        self._msg_tail[message_data.conversation_id].append(Message.model_construct(
+            message_id=message_id,
+            conversation_id=message_data.conversation_id,
+            role=message_data.role,
+            name=message_data.name,
+            content=message_data.content,
+            character_id=message_data.character_id,
+            created_at=now,
+            updated_at=now
+        ))
         return message_id
 
-    async def _create_message_async(self, message_id: str, message_data: MessageCreate):
-        """Background task to create message."""
-        try:
-            now = datetime.now().isoformat()
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
-                    """INSERT INTO messages (message_id, conversation_id, role, name, content, character_id, created_at, updated_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (message_id, message_data.conversation_id, message_data.role,
-                     message_data.name, message_data.content, message_data.character_id,
-                     now, now)
-                )
-                await conn.commit()
-            logger.debug(f"Background created message: {message_id}")
-        except Exception as e:
-            logger.error(f"Background message creation failed for conversation {message_data.conversation_id}: {e}")
-
     async def create_messages_batch(self, messages: List[MessageCreate]) -> List[Message]:
         """Create multiple messages in a single batch operation."""
         try:
-            now = datetime.now().isoformat()
-            created_messages = []
-
-            async with aiosqlite.connect(DB_PATH) as conn:
-                for msg in messages:
-                    message_id = str(uuid.uuid4())
-                    await conn.execute(
-                        """INSERT INTO messages (message_id, conversation_id, role, name, content, character_id, created_at, updated_at)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (message_id, msg.conversation_id, msg.role,
-                         msg.name, msg.content, msg.character_id, now, now)
-                    )
-                    created_messages.append(Message(
-                        message_id=message_id,
-                        conversation_id=msg.conversation_id,
-                        role=msg.role,
-                        name=msg.name,
-                        content=msg.content,
-                        character_id=msg.character_id,
-                        created_at=now,
-                        updated_at=now
-                    ))
-                await conn.commit()
+            now = _now()
+            created_messages = [
+                Message(
+                    message_id=str(uuid.uuid4()),
+                    conversation_id=msg.conversation_id,
+                    role=msg.role,
+                    name=msg.name,
+                    content=msg.content,
+                    character_id=msg.character_id,
+                    created_at=now,
+                    updated_at=now
+                )
+                for msg in messages
+            ]
+            rows = [
+                (m.message_id, m.conversation_id, m.role, m.name, m.content, m.character_id, now, now)
+                for m in created_messages
+            ]
+
+            # executemany keeps one prepared statement for every row
+            async with self._write_lock:
+                await self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    await self._conn.executemany(INSERT_MESSAGE_SQL, rows)
+                    await self._conn.execute("COMMIT")
+                except BaseException:
+                    await self._conn.execute("ROLLBACK")
+                    raise
+
+            for message in created_messages:
+                self._msg_tail[message.conversation_id].append(message)
 
             logger.info(f"Created {len(created_messages)} messages in batch")
             return created_messages
@@ -1219,26 +1478,25 @@ class DatabaseDirector:
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
     def create_messages_batch_background(self, messages: List[MessageCreate]):
-        """Create multiple messages in background (fire-and-forget)."""
-        asyncio.create_task(self._create_messages_batch_async(messages))
-
-    async def _create_messages_batch_async(self, messages: List[MessageCreate]):
-        """Background task to create messages in batch."""
-        try:
-            now = datetime.now().isoformat()
-            async with aiosqlite.connect(DB_PATH) as conn:
-                for msg in messages:
-                    message_id = str(uuid.uuid4())
-                    await conn.execute(
-                        """INSERT INTO messages (message_id, conversation_id, role, name, content, character_id, created_at, updated_at)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (message_id, msg.conversation_id, msg.role,
-                         msg.name, msg.content, msg.character_id, now, now)
-                    )
-                await conn.commit()
-            logger.debug(f"Background created {len(messages)} messages in batch")
-        except Exception as e:
-            logger.error(f"Background batch message creation failed: {e}")
+        """Queue multiple messages for the background writer (fire-and-forget)."""
+        now = _now()
+        for msg in messages:
+            message_id = str(uuid.uuid4())
+            self._write_queue.put_nowait((
+                INSERT_MESSAGE_SQL,
+                (message_id, msg.conversation_id, msg.role,
+                 msg.name, msg.content, msg.character_id, now, now)
+            ))
+            self._msg_tail[msg.conversation_id].append(Message.model_construct(
+                message_id=message_id,
+                conversation_id=msg.conversation_id,
+                role=msg.role,
+                name=msg.name,
+                content=msg.content,
+                character_id=msg.character_id,
+                created_at=now,
+                updated_at=now
+            ))
 
     async def get_messages(
         self,
@@ -1248,17 +1506,14 @@ class DatabaseDirector:
     ) -> List[Message]:
         """Get messages for a conversation with optional pagination."""
         try:
-            query = "SELECT * FROM messages WHERE conversation_id = ? ORDER BY created_at ASC"
+            query = f"SELECT {MSG_COLS} FROM messages WHERE conversation_id = ? ORDER BY created_at ASC"
             params = [conversation_id]
 
             if limit is not None:
                 query += " LIMIT ? OFFSET ?"
                 params.extend([limit, offset])
-
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(query, params)
-                rows = await cursor.fetchall()
+            cursor = await self._conn.execute(query, params)
+            rows = await cursor.fetchall()
 
             messages = [self._row_to_message(row) for row in rows]
             logger.info(f"Retrieved {len(messages)} messages for conversation {conversation_id}")
@@ -1271,17 +1526,28 @@ class DatabaseDirector:
     async def get_recent_messages(self, conversation_id: str, n: int = 10) -> List[Message]:
         """Get the last N messages from a conversation."""
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(
-                    """SELECT * FROM messages WHERE conversation_id = ?
-                       ORDER BY created_at DESC LIMIT ?""",
-                    (conversation_id, n)
-                )
-                rows = await cursor.fetchall()
+            # The tail always holds the newest messages, so n of them is
+            # authoritative — no SELECT needed.
+            tail = self._msg_tail.get(conversation_id)
+            if tail is not None and len(tail) >= n:
+                return list(tail)[-n:]
+
+            cursor = await self._conn.execute(
+                f"""SELECT {MSG_COLS} FROM messages WHERE conversation_id = ?
+                    ORDER BY created_at DESC LIMIT ?""",
+                (conversation_id, n)
+            )
+            rows = await cursor.fetchall()
 
             # Reverse to get chronological order
             messages = [self._row_to_message(row) for row in reversed(rows)]
+
+            # Warm the tail from a cold start. Re-check after the await: a
+            # background append during the fetch means the tail now holds
+            # newer messages the SELECT can't see, so leave it alone.
+            if not self._msg_tail.get(conversation_id) and messages:
+                self._msg_tail[conversation_id].extend(messages)
+
             logger.info(f"Retrieved last {len(messages)} messages for conversation {conversation_id}")
             return messages
 
@@ -1292,14 +1558,16 @@ class DatabaseDirector:
     async def get_last_message(self, conversation_id: str) -> Optional[Message]:
         """Get the last message from a conversation."""
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                conn.row_factory = aiosqlite.Row
-                cursor = await conn.execute(
-                    """SELECT * FROM messages WHERE conversation_id = ?
-                       ORDER BY created_at DESC LIMIT 1""",
-                    (conversation_id,)
-                )
-                row = await cursor.fetchone()
+            tail = self._msg_tail.get(conversation_id)
+            if tail:
+                return tail[-1]
+
+            cursor = await self._conn.execute(
+                f"""SELECT {MSG_COLS} FROM messages WHERE conversation_id = ?
+                    ORDER BY created_at DESC LIMIT 1""",
+                (conversation_id,)
+            )
+            row = await cursor.fetchone()
 
             if not row:
                 return None
@@ -1313,12 +1581,11 @@ class DatabaseDirector:
     async def get_message_count(self, conversation_id: str) -> int:
         """Get the total number of messages in a conversation."""
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                cursor = await conn.execute(
-                    "SELECT COUNT(*) FROM messages WHERE conversation_id = ?",
-                    (conversation_id,)
-                )
-                row = await cursor.fetchone()
+            cursor = await self._conn.execute(
+                "SELECT message_count FROM conversations WHERE conversation_id = ?",
+                (conversation_id,)
+            )
+            row = await cursor.fetchone()
 
             count = row[0] if row else 0
             logger.info(f"Conversation {conversation_id} has {count} messages")
@@ -1331,9 +1598,16 @@ class DatabaseDirector:
     async def delete_message(self, message_id: str) -> bool:
         """Delete a single message."""
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute("DELETE FROM messages WHERE message_id = ?", (message_id,))
-                await conn.commit()
+            async with self._write_lock:
+                cursor = await self._conn.execute(
+                    "DELETE FROM messages WHERE message_id = ? RETURNING conversation_id",
+                    (message_id,)
+                )
+                row = await cursor.fetchone()
+
+            # Tail no longer mirrors the table; drop it and rewarm on next read.
+            if row:
+                self._msg_tail.pop(row[0], None)
 
             logger.info(f"Deleted message {message_id}")
             return True
@@ -1345,12 +1619,12 @@ class DatabaseDirector:
     async def delete_messages_for_conversation(self, conversation_id: str) -> bool:
         """Delete all messages for a conversation."""
         try:
-            async with aiosqlite.connect(DB_PATH) as conn:
-                await conn.execute(
+            async with self._write_lock:
+                await self._conn.execute(
                     "DELETE FROM messages WHERE conversation_id = ?",
                     (conversation_id,)
                 )
-                await conn.commit()
+            self._msg_tail.pop(conversation_id, None)
 
             logger.info(f"Deleted messages for conversation {conversation_id}")
             return True
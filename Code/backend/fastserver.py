@@ -266,9 +266,9 @@ class ChatLLM:
             ConversationCreate(active_characters=active_char_data)
         )
 
-    async def get_active_characters(self) -> List[Character]:
-        """Get active characters from database"""
-        return await db.get_active_characters()
+    def get_active_characters(self) -> List[Character]:
+        """Get active characters from the in-memory cache (no DB hop)"""
+        return db.get_active_characters_sync()
 
     def set_model_settings(self, model_settings: ModelSettings):
         """Set model settings for LLM requests"""
@@ -873,7 +873,7 @@ class WebSocketManager:
         self.transcribe.set_event_loop(asyncio.get_event_loop())
 
         self.chat = ChatLLM(queues=self.queues, api_key=api_key)
-        self.chat.active_characters = await self.chat.get_active_characters()
+        self.chat.active_characters = self.chat.get_active_characters()
 
         self.speech = Speech(queues=self.queues)
         await self.speech.initialize()
@@ -1125,7 +1125,12 @@ class WebSocketManager:
             elif message_type == "get_conversations":
                 limit = payload.get("limit")
                 offset = payload.get("offset", 0)
-                conversations = await db.get_all_conversations(limit=limit, offset=offset)
+                conversations = await db.get_all_conversations(
+                    limit=limit,
+                    offset=offset,
+                    before_updated_at=payload.get("before_updated_at"),
+                    before_id=payload.get("before_id")
+                )
                 await self.send_text_to_client({
                     "type": "conversations_data",
                     "data": [c.model_dump() for c in conversations]
@@ -1345,7 +1350,7 @@ class WebSocketManager:
         if not self.chat:
             return
 
-        self.chat.active_characters = await self.chat.get_active_characters()
+        self.chat.active_characters = self.chat.get_active_characters()
         logger.info(f"Synced to {len(self.chat.active_characters)} active characters")
 
         if update_conversation:
@@ -1479,6 +1484,7 @@ async def lifespan(app: FastAPI):
     yield
     print("Shutting down services...")
     await ws_manager.shutdown()
+    await db.close()
     print("All services shut down!")
 
 app = FastAPI(lifespan=lifespan)